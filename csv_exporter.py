@@ -19,11 +19,18 @@ from plotly.subplots import make_subplots
 
 logger = logging.getLogger(__name__)
 
+# Archive members that are already compressed, so DEFLATE only burns CPU on them
+_PRECOMPRESSED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.pdf', '.zip', '.gz')
+
+# zipfile only writes Zstandard members from Python 3.14
+_ZIP_ZSTANDARD = getattr(zipfile, 'ZIP_ZSTANDARD', None)
+
 
 class CSVExporter:
     """Exports metrics and results to CSV and generates graphs."""
     
-    def __init__(self, results_dir: str, csv_filename: str, enable_graphs: bool = True, graph_format: str = "png", skip_archiving: bool = False):
+    def __init__(self, results_dir: str, csv_filename: str, enable_graphs: bool = True, graph_format: str = "png", skip_archiving: bool = False,
+                 archive_compression: str = "auto"):
         """
         Initialize the CSV exporter.
         
@@ -33,11 +40,17 @@ class CSVExporter:
             enable_graphs: Whether to generate graphs
             graph_format: Graph output format (png, svg, pdf)
             skip_archiving: If True, don't archive existing files on init (for recovery script)
+            archive_compression: Compression for the results archive: "auto" (stored for
+                already-compressed files, deflate for the rest), "stored", "deflate" or "zstd"
         """
         self.results_dir = results_dir
         self.csv_filename = csv_filename
         self.enable_graphs = enable_graphs
         self.graph_format = graph_format
+        if archive_compression == "zstd" and _ZIP_ZSTANDARD is None:
+            logger.warning("zstd archives need Python 3.14+, using deflate instead")
+            archive_compression = "deflate"
+        self.archive_compression = archive_compression
         
         # Create results directory if it doesn't exist
         os.makedirs(results_dir, exist_ok=True)
@@ -524,7 +537,8 @@ class CSVExporter:
         Generate graph for API performance metrics.
         
         Args:
-            api_data: Dictionary with API analysis results
+            api_data: Dictionary with API analysis results. 'requests' is a list
+                      of request dicts or a DataFrame with the same columns
             
         Returns:
             Path to the generated graph file
@@ -532,12 +546,15 @@ class CSVExporter:
         try:
             requests = api_data.get('requests', [])
             
-            if not requests:
+            if len(requests) == 0:
                 logger.warning("No API request data to plot")
                 return ""
             
-            # Convert to DataFrame
-            df = pd.DataFrame(requests)
+            # Convert to DataFrame (a frame is copied: columns are added below)
+            if isinstance(requests, pd.DataFrame):
+                df = requests.copy()
+            else:
+                df = pd.DataFrame(requests)
             df['timestamp'] = pd.to_datetime(df['timestamp'])
             df = df.sort_values('timestamp')
             
@@ -1506,9 +1523,17 @@ class CSVExporter:
             if not os.path.exists(self.results_dir):
                 return
             
-            files_to_archive = [f for f in os.listdir(self.results_dir) 
+            result_files = os.listdir(self.results_dir)
+            files_to_archive = [f for f in result_files 
                                if f.endswith(('.csv', '.html', '.png', '.svg', '.pdf'))]
             
+            # Parquet copies written by generate_reports.py's CSV cache are derived
+            # from the CSVs, so they are deleted rather than archived
+            for filename in result_files:
+                if filename.endswith('.csv.parquet'):
+                    os.remove(os.path.join(self.results_dir, filename))
+                    logger.debug(f"Removed CSV cache: {filename}")
+            
             # Check if web_report directory exists
             web_report_dir = os.path.join(self.results_dir, 'web_report')
             has_web_report = os.path.exists(web_report_dir)
@@ -1552,6 +1577,24 @@ class CSVExporter:
         except Exception as e:
             logger.warning(f"Failed to archive old results: {e}")
     
+    def _archive_compress_type(self, filename: str) -> int:
+        """
+        Pick the zip compression method for one results archive member.
+        
+        Args:
+            filename: Name of the file being added
+            
+        Returns:
+            zipfile compression constant
+        """
+        if self.archive_compression == "stored":
+            return zipfile.ZIP_STORED
+        if self.archive_compression == "zstd":
+            return _ZIP_ZSTANDARD
+        if self.archive_compression == "auto" and filename.lower().endswith(_PRECOMPRESSED_EXTENSIONS):
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+    
     def create_results_archive(self) -> str:
         """
         Create a zip archive containing web_report contents (index.html + src/).
@@ -1574,7 +1617,7 @@ class CSVExporter:
                         file_path = os.path.join(root, file)
                         # Create relative path from web_report dir (removes web_report/ prefix)
                         arcname = os.path.relpath(file_path, web_report_dir)
-                        zipf.write(file_path, arcname)
+                        zipf.write(file_path, arcname, compress_type=self._archive_compress_type(file))
                         file_count += 1
             
             logger.info(f"Created results archive: {self.archive_zip} ({file_count} files: index.html + src/)")
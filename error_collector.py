@@ -7,15 +7,272 @@ during test execution.
 """
 
 import logging
+import os
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import IO, List, Dict, Optional, Iterable, Tuple, Callable, Any
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+import numpy as np
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional: similarity candidates are then checked one by one
+    fuzz = process = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional: falls back to a compiled keyword regex
+    ahocorasick = None
+
+try:
+    from numba import njit
+except ImportError:  # optional: without rapidfuzz, pairs then go straight to SequenceMatcher
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Log line patterns, compiled once at import instead of on every call
+_TS = r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}'
+
+# Log level field of the OpenStack format: timestamp + PID + LEVEL + module.
+# oslo.log always writes the level upper-case, which lets the ERROR/CRITICAL
+# check be gated by a plain substring test.
+_ERROR_LEVEL_RE = re.compile(_TS + r'[.,]\d+\s+\d+\s+(ERROR|CRITICAL)\s+')
+_QUIET_LEVEL_RE = re.compile(_TS + r'[.,]\d+\s+\d+\s+(DEBUG|INFO|WARNING)\s+', re.IGNORECASE)
+
+_TIMESTAMP_RE = re.compile(f'({_TS})')
+_LOG_ENTRY_START_RE = re.compile(_TS)  # used with .match() - start of a new log entry
+_MODULE_PREFIX_RE = re.compile(r'(ERROR|CRITICAL)\s+[\w\.]+', re.IGNORECASE)
+_NON_ERROR_LEVEL_RE = re.compile(r'(INFO|DEBUG|WARNING)\s', re.IGNORECASE)
+_CRITICAL_RE = re.compile('CRITICAL', re.IGNORECASE)
+_STACK_FRAME_RE = re.compile(r'\s+File\s+"')
+_TRACEBACK_FRAGMENT_RE = re.compile(r'\s+(File|return|raise|def|class)')
+
+# Context extraction stops at the next real ERROR/CRITICAL entry: a timestamped
+# line with the level as a whole word (upper-case, as oslo.log writes it)
+_ERROR_ENTRY_RE = re.compile(_TS + r'.*?\b(?:ERROR|CRITICAL)\b')
+
+# Dynamic content replaced by _normalize_error_text, applied in order
+_NORMALIZE_SUBSTITUTIONS = (
+    # Timestamps (various formats)
+    (re.compile(_TS + r'(\.\d+)?([+-]\d{2}:\d{2}|Z)?'), '<TIMESTAMP>'),
+    (re.compile(r'\d{2}/[A-Za-z]{3}/\d{4}:\d{2}:\d{2}:\d{2}'), '<TIMESTAMP>'),
+    # UUIDs
+    (re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE), '<UUID>'),
+    # Request IDs (req-xxx)
+    (re.compile(r'req-[0-9a-f-]+', re.IGNORECASE), '<REQ-ID>'),
+    # IP addresses
+    (re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(:\d+)?\b'), '<IP>'),
+    # Numeric IDs (but keep error codes)
+    (re.compile(r'\bid[:=]\s*\d+\b', re.IGNORECASE), 'id=<ID>'),
+    # Memory addresses
+    (re.compile(r'0x[0-9a-fA-F]+'), '<ADDR>'),
+    # Traceback frame line numbers (File "...", line 123, in ...)
+    (re.compile(r'(File "[^"]*", line )\d+'), r'\1<N>'),
+)
+
+# Comprehensive list of error keywords to detect potential problems,
+# matched against the upper-cased first 50 characters of a line
+_ERROR_KEYWORDS = (
+    # Basic error levels
+    'ERROR', 'CRITICAL', 'FATAL', 'PANIC', 'FAIL', 'FAILED',
+    
+    # Exception indicators
+    'EXCEPTION', 'TRACEBACK', 'RAISE', 'THROWN',
+    
+    # Connectivity/Network issues
+    'TIMEOUT', 'TIMED OUT', 'REFUSED', 'UNREACHABLE', 'DISCONNECT',
+    'CONNECTION', 'CLOSED', 'BROKEN PIPE', 'RESET', 'ABORT',
+    
+    # Python exceptions (common ones)
+    'KEYERROR', 'VALUEERROR', 'ATTRIBUTEERROR', 'TYPEERROR',
+    'INDEXERROR', 'IMPORTERROR', 'RUNTIMEERROR', 'MEMORYERROR',
+    'OSERROR', 'IOERROR', 'ASSERTIONERROR',
+    
+    # Java exceptions (common ones)
+    'NULLPOINTEREXCEPTION', 'OUTOFMEMORYERROR', 'STACKOVERFLOWERROR',
+    'ILLEGALARGUMENTEXCEPTION', 'CLASSNOTFOUNDEXCEPTION',
+    
+    # System/Resource issues
+    'CRASH', 'HUNG', 'DEADLOCK', 'CORRUPT', 'SEGFAULT',
+    'CORE DUMP', 'OOM', 'OUT OF MEMORY',
+    
+    # Access/Permission issues
+    'DENIED', 'FORBIDDEN', 'UNAUTHORIZED', 'PERMISSION',
+    
+    # Availability issues
+    'UNAVAILABLE', 'DOWN', 'OFFLINE', 'UNREACHABLE',
+    
+    # Database issues
+    'ROLLBACK', 'CONSTRAINT', 'INTEGRITY',
+    
+    # Validation issues
+    'INVALID', 'MALFORMED', 'UNEXPECTED',
+    
+    # HTTP error codes (in text form for logs)
+    'HTTP 4', 'HTTP 5', 'STATUS 4', 'STATUS 5',
+    '500 ', '502 ', '503 ', '504 ',
+)
+
+# Every keyword found in a single pass instead of one substring search each:
+# an Aho-Corasick automaton when pyahocorasick is installed, otherwise one
+# compiled alternation
+_ERROR_KEYWORD_RE = re.compile('|'.join(map(re.escape, _ERROR_KEYWORDS)))
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _ERROR_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+# grep prefilter run between oc and Python. Every line that can start an error
+# block contains one of the keywords (the ERROR/CRITICAL level included), and
+# -A keeps the 200 lines a traceback block can consume or peek at after its
+# first line, so extraction sees exactly the lines it would have read anyway.
+_GREP_BLOCK_LINES = 200
+_GREP_PREFILTER = ['-a', '-i', '-E', '-A', str(_GREP_BLOCK_LINES), '--no-group-separator',
+                   '|'.join(_ERROR_KEYWORDS)]
+
+# Width of the length bands unique errors are indexed by when deduplicating
+_LEN_BUCKET_WIDTH = 32
+
+# Up to this many distinct error texts, rapidfuzz scores every pair up front in
+# one cdist call (a uint8 matrix, so ~16MB at the cap). Scoring all pairs is
+# more work than the length-banded scan, so it's only a win spread over cores.
+_CDIST_MAX_TEXTS = 4000
+_CDIST_MIN_CPUS = 4
+
+# ANSI escape sequences: ESC[...m (also incomplete ones) and standalone [XXm
+_ANSI_ESCAPE_RE = re.compile(r'(\x1b|\033)\[[0-9;]*[a-zA-Z]?|\[[0-9]{1,2}m')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Apply _NORMALIZE_SUBSTITUTIONS. Cached: the same raw block often recurs across pods and retries."""
+    for pattern, replacement in _NORMALIZE_SUBSTITUTIONS:
+        text = pattern.sub(replacement, text)
+    # Collapse whitespace runs and trim; same result as re.sub(r'\s+', ' ') + strip().
+    # Interned: blocks differing only in timestamps/IDs then share one string,
+    # and the dedup exact-match lookup succeeds on identity without comparing.
+    return sys.intern(' '.join(text.split()))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _lcs_length(a_symbols, symbol_count, b_symbols):
+        """
+        Bit-parallel (Hyyro) LCS length of two symbol sequences.
+        
+        a_symbols indexes into an alphabet of symbol_count symbols; b_symbols
+        uses the same indexes, with -1 for symbols that don't occur in a.
+        """
+        length = a_symbols.shape[0]
+        words = (length + 63) // 64
+        one = np.uint64(1)
+        
+        # Per symbol, the bitmask of the positions in a where it occurs
+        peq = np.zeros((symbol_count, words), dtype=np.uint64)
+        for i in range(length):
+            peq[a_symbols[i], i // 64] |= one << np.uint64(i % 64)
+        
+        # S = (S + (S & M)) | (S & ~M), added across words with carry
+        s = np.full(words, ~np.uint64(0), dtype=np.uint64)
+        for symbol in b_symbols:
+            if symbol < 0:
+                continue
+            carry = np.uint64(0)
+            for w in range(words):
+                u = s[w] & peq[symbol, w]
+                x = s[w] + carry
+                overflow = x < s[w]
+                total = x + u
+                overflow = overflow or total < x
+                s[w] = total | (s[w] - u)
+                carry = one if overflow else np.uint64(0)
+        
+        # Zero bits of S within the first `length` positions are the LCS
+        lcs = 0
+        for i in range(length):
+            if not (s[i // 64] >> np.uint64(i % 64)) & one:
+                lcs += 1
+        return lcs
+else:
+    _lcs_length = None
+
+
+def _indel_ratio(text1: str, text2: str) -> float:
+    """
+    Indel similarity 2*LCS/(len1+len2) * 100 of two texts, via the JIT-compiled kernel.
+    
+    SequenceMatcher only counts matches it can chain into blocks, never more
+    than the LCS, so this is an upper bound on its ratio().
+    """
+    a = np.frombuffer(text1.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    b = np.frombuffer(text2.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    alphabet, a_symbols = np.unique(a, return_inverse=True)
+    positions = np.minimum(np.searchsorted(alphabet, b), len(alphabet) - 1)
+    b_symbols = np.where(alphabet[positions] == b, positions, -1)
+    lcs = _lcs_length(a_symbols.astype(np.int64), len(alphabet), b_symbols.astype(np.int64))
+    return 200 * lcs / (len(a) + len(b))
+
+
+# Seconds allowed for streaming one pod's logs before oc is killed
+_LOG_FETCH_TIMEOUT = 60
+# Upper bound on concurrent `oc logs` fetches
+_MAX_LOG_WORKERS = 50
+
+
+class _LineWindow:
+    """
+    Read-ahead buffer over a stream of log lines.
+    
+    Holds only the lines between the current position and the furthest line
+    looked at, so block extraction can peek ahead without the whole log in memory.
+    Each line is classified once as it is read (blank, starts a new log entry),
+    so peeking at a line and later visiting it doesn't rerun the checks.
+    """
+    
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._buffer = deque()  # (line, is_blank, starts_entry)
+    
+    def has(self, count: int) -> bool:
+        """Return True if at least `count` lines are available from the current position."""
+        while len(self._buffer) < count:
+            line = next(self._lines, None)
+            if line is None:
+                return False
+            # A timestamp starts with a digit; skip the regex for all other lines
+            starts_entry = line[:1].isdigit() and _LOG_ENTRY_START_RE.match(line) is not None
+            self._buffer.append((line, not line.strip(), starts_entry))
+        return True
+    
+    def __getitem__(self, offset: int) -> str:
+        return self._buffer[offset][0]
+    
+    def is_blank(self, offset: int) -> bool:
+        return self._buffer[offset][1]
+    
+    def starts_entry(self, offset: int) -> bool:
+        """True if the line starts with a timestamp, i.e. begins a new log entry."""
+        return self._buffer[offset][2]
+    
+    def advance(self, count: int) -> None:
+        """Drop `count` lines from the front of the window."""
+        for _ in range(count):
+            self._buffer.popleft()
+
 
 class ErrorCollector:
     """
@@ -62,6 +319,130 @@ class ErrorCollector:
         # Number of context lines to capture before and after an error (for debugging context)
         self.context_lines_before = 5
         self.context_lines_after = 5
+        
+        # Most recent log lines fetched per pod (passed to oc logs --tail).
+        # -1 fetches everything since the start time; set a positive cap to
+        # bound the fetch on very chatty pods at the cost of older lines.
+        self.max_log_lines = -1
+        
+        # Label selector matching the monitored pods (e.g.
+        # 'app.kubernetes.io/part-of=openstack'). When set, all pod logs are
+        # pulled with a single `oc logs -l <selector> --prefix` instead of one
+        # oc process per pod; None keeps the per-pod fetches.
+        self.log_selector = None
+        
+        # Worker processes for the per-pod fetch and parse. 0 keeps the thread
+        # pool, which is enough while grep prefilters the logs; set it (e.g. to
+        # os.cpu_count()) when block extraction itself is the bottleneck.
+        self.parse_processes = 0
+        
+        # grep is used to prefilter pod logs when available (see _open_log_stream)
+        self.grep_path = shutil.which('grep')
+        self._grep_supported = None  # probed on first use
+    
+    def _can_prefilter_with_grep(self) -> bool:
+        """
+        Check once whether grep can be used as the log prefilter.
+        
+        The prefilter needs --no-group-separator (GNU grep), otherwise "--"
+        lines between context groups would end up inside error blocks.
+        
+        Returns:
+            True if grep is installed and supports the prefilter options
+        """
+        if self._grep_supported is None:
+            self._grep_supported = False
+            if self.grep_path:
+                try:
+                    probe = subprocess.run([self.grep_path, '--no-group-separator', '-q', 'x', os.devnull],
+                                           capture_output=True, timeout=10)
+                    # 1 = no match (expected), 2 = unknown option
+                    self._grep_supported = probe.returncode in (0, 1)
+                except Exception as e:
+                    logger.debug(f"grep prefilter unavailable: {e}")
+        return self._grep_supported
+    
+    def _open_log_stream(self, cmd: List[str], stderr_file: IO[bytes]) -> Tuple[subprocess.Popen, subprocess.Popen]:
+        """
+        Start `oc logs`, piped through grep to drop lines that can't be part of an error.
+        
+        Args:
+            cmd: The oc logs command to run
+            stderr_file: File oc's stderr is written to
+            
+        Returns:
+            Tuple of (oc process, process whose text stdout yields log lines).
+            Both are the same process when grep can't be used.
+        """
+        oc_proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+        if not self._can_prefilter_with_grep():
+            return oc_proc, oc_proc
+        
+        try:
+            # C locale keeps grep on its fast byte-oriented matcher
+            grep_proc = subprocess.Popen(
+                [self.grep_path] + _GREP_PREFILTER,
+                stdin=oc_proc.stdout, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, env=dict(os.environ, LC_ALL='C')
+            )
+        except Exception:
+            oc_proc.kill()
+            oc_proc.wait()
+            raise
+        # Drop our copy of the pipe so oc gets SIGPIPE if grep exits early
+        oc_proc.stdout.close()
+        return oc_proc, grep_proc
+    
+    def _consume_log_stream(self, cmd: List[str], consume: Callable[[Iterable[str]], Any],
+                            timeout: float) -> Tuple[Any, int, str]:
+        """
+        Run an `oc logs` command and hand its (prefiltered) output to `consume` as it arrives.
+        
+        The output is streamed rather than buffered; the timer kills the
+        processes once `timeout` seconds have passed, the way run(timeout=...) did.
+        
+        Args:
+            cmd: The oc logs command to run
+            consume: Called with the stream of output lines (with line endings)
+            timeout: Seconds the whole fetch may take
+        
+        Returns:
+            Tuple of (consume's return value, oc exit status, oc stderr)
+        
+        Raises:
+            subprocess.TimeoutExpired: If the fetch took longer than `timeout`
+        """
+        # oc's stderr goes to a temp file rather than a pipe: a pipe is only read
+        # after stdout is drained, so oc would block once it filled the pipe
+        # buffer with warnings and the fetch would stall until the timer fired
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            oc_proc, log_proc = self._open_log_stream(cmd, stderr_file)
+        except Exception:
+            stderr_file.close()
+            raise
+        timed_out = threading.Event()
+        
+        def _kill_on_timeout():
+            timed_out.set()
+            oc_proc.kill()
+            log_proc.kill()
+        
+        timer = threading.Timer(timeout, _kill_on_timeout)
+        timer.start()
+        try:
+            with stderr_file, oc_proc, log_proc:
+                result = consume(log_proc.stdout)
+                oc_proc.wait()
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors='replace')
+        finally:
+            timer.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        return result, oc_proc.returncode, stderr
     
     def detect_openstack_pods(self) -> List[Dict]:
         """
@@ -71,10 +452,15 @@ class ErrorCollector:
             List of dictionaries with pod info: {'name': str, 'service': str, 'type': str}
         """
         try:
+            # Only the name and phase are used, so ask for just those two columns
+            # instead of pulling and parsing the full pod JSON. Pending/Unknown
+            # pods have no logs to read, so the API server drops them already.
             cmd = [
                 'oc', 'get', 'pods',
                 '-n', self.namespace,
-                '-o', 'json'
+                '--field-selector=status.phase!=Pending,status.phase!=Unknown',
+                '--no-headers',
+                '-o', 'custom-columns=NAME:.metadata.name,PHASE:.status.phase'
             ]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             
@@ -82,13 +468,19 @@ class ErrorCollector:
                 logger.error(f"Failed to get pods: {result.stderr}")
                 return []
             
-            import json
-            pods_data = json.loads(result.stdout)
+            # All service patterns in one alternation, so each pod name is scanned
+            # once. Longest first, so a pattern wins over any shorter one it contains.
+            pod_pattern_re = re.compile('|'.join(
+                sorted(map(re.escape, self.openstack_pod_patterns), key=len, reverse=True)
+            ))
             
             detected_pods = []
-            for pod in pods_data.get('items', []):
-                pod_name = pod['metadata']['name']
-                phase = pod['status'].get('phase', '')
+            for row in result.stdout.splitlines():
+                fields = row.split()
+                if not fields:
+                    continue
+                pod_name = fields[0]
+                phase = fields[1] if len(fields) > 1 else ''
                 
                 # Check if pod is running (or completed/succeeded for test pods)
                 # Test pods may be in 'Succeeded' state but we still want their logs
@@ -97,17 +489,16 @@ class ErrorCollector:
                 
                 # Check OpenStack service pods
                 matched = False
-                for pattern in self.openstack_pod_patterns:
-                    if pattern in pod_name:
-                        # Extract service name (e.g., 'octavia' from 'octavia-api-xyz')
-                        service = pattern.split('-')[0]
-                        detected_pods.append({
-                            'name': pod_name,
-                            'service': service,
-                            'type': 'openstack'
-                        })
-                        matched = True
-                        break
+                pattern_match = pod_pattern_re.search(pod_name)
+                if pattern_match:
+                    # Extract service name (e.g., 'octavia' from 'octavia-api-xyz')
+                    service = pattern_match.group(0).split('-')[0]
+                    detected_pods.append({
+                        'name': pod_name,
+                        'service': service,
+                        'type': 'openstack'
+                    })
+                    matched = True
                 
                 # Check test pods if not already matched
                 if not matched:
@@ -174,8 +565,10 @@ class ErrorCollector:
         """
         # Match OpenStack log format: timestamp + PID + log_level + module
         # Look for ERROR or CRITICAL in the log level field (after timestamp/PID, before module name)
-        pattern = r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}[.,]\d+\s+\d+\s+(ERROR|CRITICAL)\s+'
-        return re.search(pattern, line, re.IGNORECASE) is not None
+        # Most lines are INFO/DEBUG - reject them without running the regex
+        if 'ERROR' not in line and 'CRITICAL' not in line:
+            return False
+        return _ERROR_LEVEL_RE.match(line) is not None
     
     def _is_debug_info_warning_level(self, line: str) -> bool:
         """
@@ -200,8 +593,7 @@ class ErrorCollector:
         """
         # Match OpenStack log format: timestamp + PID + log_level + module
         # Look for DEBUG, INFO, or WARNING in the log level field
-        pattern = r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}[.,]\d+\s+\d+\s+(DEBUG|INFO|WARNING)\s+'
-        return re.search(pattern, line, re.IGNORECASE) is not None
+        return _QUIET_LEVEL_RE.match(line) is not None
     
     def _has_error_keywords_in_prefix(self, line: str) -> bool:
         """
@@ -244,52 +636,15 @@ class ErrorCollector:
             ✅ "Service unavailable (503)" → True
             ❌ "This is a normal log line mentioning error later in the message..." → False
         """
-        # Check first 50 characters only
+        # Check first 50 characters only. Upper-casing this short copy and
+        # scanning it case-sensitively is ~10x faster than an IGNORECASE
+        # search bounded with endpos=50, and lines of 50 chars or less are
+        # not copied by the slice at all
         prefix = line[:50].upper()
         
-        # Comprehensive list of error keywords to detect potential problems
-        error_keywords = [
-            # Basic error levels
-            'ERROR', 'CRITICAL', 'FATAL', 'PANIC', 'FAIL', 'FAILED',
-            
-            # Exception indicators
-            'EXCEPTION', 'TRACEBACK', 'RAISE', 'THROWN',
-            
-            # Connectivity/Network issues
-            'TIMEOUT', 'TIMED OUT', 'REFUSED', 'UNREACHABLE', 'DISCONNECT',
-            'CONNECTION', 'CLOSED', 'BROKEN PIPE', 'RESET', 'ABORT',
-            
-            # Python exceptions (common ones)
-            'KEYERROR', 'VALUEERROR', 'ATTRIBUTEERROR', 'TYPEERROR',
-            'INDEXERROR', 'IMPORTERROR', 'RUNTIMEERROR', 'MEMORYERROR',
-            'OSERROR', 'IOERROR', 'ASSERTIONERROR',
-            
-            # Java exceptions (common ones)
-            'NULLPOINTEREXCEPTION', 'OUTOFMEMORYERROR', 'STACKOVERFLOWERROR',
-            'ILLEGALARGUMENTEXCEPTION', 'CLASSNOTFOUNDEXCEPTION',
-            
-            # System/Resource issues
-            'CRASH', 'HUNG', 'DEADLOCK', 'CORRUPT', 'SEGFAULT',
-            'CORE DUMP', 'OOM', 'OUT OF MEMORY',
-            
-            # Access/Permission issues
-            'DENIED', 'FORBIDDEN', 'UNAUTHORIZED', 'PERMISSION',
-            
-            # Availability issues
-            'UNAVAILABLE', 'DOWN', 'OFFLINE', 'UNREACHABLE',
-            
-            # Database issues
-            'ROLLBACK', 'CONSTRAINT', 'INTEGRITY',
-            
-            # Validation issues
-            'INVALID', 'MALFORMED', 'UNEXPECTED',
-            
-            # HTTP error codes (in text form for logs)
-            'HTTP 4', 'HTTP 5', 'STATUS 4', 'STATUS 5',
-            '500 ', '502 ', '503 ', '504 ',
-        ]
-        
-        return any(keyword in prefix for keyword in error_keywords)
+        if _KEYWORD_AUTOMATON is not None:
+            return next(_KEYWORD_AUTOMATON.iter(prefix), None) is not None
+        return _ERROR_KEYWORD_RE.search(prefix) is not None
     
     def _normalize_error_text(self, text: str) -> str:
         """
@@ -308,29 +663,7 @@ class ErrorCollector:
         Returns:
             Normalized text for comparison
         """
-        # Remove timestamps (various formats)
-        text = re.sub(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d+)?([+-]\d{2}:\d{2}|Z)?', '<TIMESTAMP>', text)
-        text = re.sub(r'\d{2}/[A-Za-z]{3}/\d{4}:\d{2}:\d{2}:\d{2}', '<TIMESTAMP>', text)
-        
-        # Remove UUIDs
-        text = re.sub(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', '<UUID>', text, flags=re.IGNORECASE)
-        
-        # Remove request IDs (req-xxx)
-        text = re.sub(r'req-[0-9a-f-]+', '<REQ-ID>', text, flags=re.IGNORECASE)
-        
-        # Remove IP addresses
-        text = re.sub(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(:\d+)?\b', '<IP>', text)
-        
-        # Remove numeric IDs (but keep error codes)
-        text = re.sub(r'\bid[:=]\s*\d+\b', 'id=<ID>', text, flags=re.IGNORECASE)
-        
-        # Remove memory addresses
-        text = re.sub(r'0x[0-9a-fA-F]+', '<ADDR>', text)
-        
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        return _normalize_text(text)
     
     def _strip_ansi_codes(self, text: str) -> str:
         """
@@ -353,25 +686,53 @@ class ErrorCollector:
             Input:  "message[00m"
             Output: "message"
         """
-        # Pattern matches ANSI escape sequences:
-        # \x1b[...m  or  \033[...m  (ESC[...m format)
-        # \x1b[...  (incomplete sequences)
-        # Also match standalone [XXm patterns (common in some log outputs)
-        ansi_escape = re.compile(r'(\x1b|\033)\[[0-9;]*[a-zA-Z]?|\[[0-9]{1,2}m')
-        return ansi_escape.sub('', text)
+        return _ANSI_ESCAPE_RE.sub('', text)
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
+    def _calculate_similarity(self, text1: str, text2: str, score_cutoff: float = 0,
+                              matchers: Optional[Dict[str, SequenceMatcher]] = None) -> float:
         """
         Calculate similarity between two error texts using SequenceMatcher.
         
+        With a score_cutoff, pairs are first rejected by the Indel ratio
+        (2*LCS/(len1+len2)) from rapidfuzz, or from the numba kernel without it.
+        It is never below SequenceMatcher's ratio, so only pairs that can't
+        reach the cutoff are dropped and returned scores are unchanged.
+        
         Args:
             text1: First error text (normalized)
             text2: Second error text (normalized)
+            score_cutoff: Pairs that cannot reach this score return 0 early
+            matchers: Optional cache of SequenceMatchers keyed by text2. The
+                      index SequenceMatcher builds over its second sequence is
+                      then reused when text2 is compared again.
         
         Returns:
             Similarity score (0-100)
         """
-        return SequenceMatcher(None, text1, text2).ratio() * 100
+        if score_cutoff:
+            # ratio() can't exceed 2*min/(len1+len2) (what real_quick_ratio()
+            # computes), so check it before SequenceMatcher indexes text2
+            len1, len2 = len(text1), len(text2)
+            if len1 + len2 and 200 * min(len1, len2) < score_cutoff * (len1 + len2):
+                return 0.0
+            if fuzz is not None:
+                if not fuzz.ratio(text1, text2, score_cutoff=score_cutoff):
+                    return 0.0
+            elif _lcs_length is not None and len1 and len2 and _indel_ratio(text1, text2) < score_cutoff:
+                return 0.0
+        
+        if matchers is None:
+            matcher = SequenceMatcher(None, text1, text2)
+        else:
+            matcher = matchers.get(text2)
+            if matcher is None:
+                matcher = matchers[text2] = SequenceMatcher(None, text1, text2)
+            else:
+                matcher.set_seq1(text1)
+        # quick_ratio() is another cheap upper bound on ratio()
+        if score_cutoff and matcher.quick_ratio() * 100 < score_cutoff:
+            return 0.0
+        return matcher.ratio() * 100
     
     def _extract_context_before(self, lines: List[str], error_line_index: int) -> List[str]:
         """
@@ -398,11 +759,10 @@ class ErrorCollector:
             
             line = lines[idx]
             
-            # Stop if we hit another ERROR/CRITICAL (don't mix errors)
-            if re.search(r'\b(ERROR|CRITICAL)\b', line, re.IGNORECASE):
-                # Check if it's a real error line (not just a string containing "error")
-                if re.search(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}.*?(ERROR|CRITICAL)', line, re.IGNORECASE):
-                    break
+            # Stop if we hit another ERROR/CRITICAL entry (don't mix errors),
+            # not just a line mentioning "error"
+            if _ERROR_ENTRY_RE.search(line):
+                break
             
             # Stop at empty lines followed by another empty line (log block separator)
             if not line.strip():
@@ -442,11 +802,10 @@ class ErrorCollector:
             
             line = lines[idx]
             
-            # Stop if we hit another ERROR/CRITICAL (don't mix errors)
-            if re.search(r'\b(ERROR|CRITICAL)\b', line, re.IGNORECASE):
-                # Check if it's a real error line (not just a string containing "error")
-                if re.search(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}.*?(ERROR|CRITICAL)', line, re.IGNORECASE):
-                    break
+            # Stop if we hit another ERROR/CRITICAL entry (don't mix errors),
+            # not just a line mentioning "error"
+            if _ERROR_ENTRY_RE.search(line):
+                break
             
             # Stop at empty lines followed by another empty line (log block separator)
             if not line.strip():
@@ -461,9 +820,9 @@ class ErrorCollector:
         
         return context
     
-    def _extract_error_blocks(self, log_text: str, pod_name: str, service: str, pod_type: str = 'openstack') -> List[Dict]:
+    def _extract_error_blocks(self, lines: Iterable[str], pod_name: str, service: str, pod_type: str = 'openstack') -> List[Dict]:
         """
-        Extract complete error blocks from log text, including full Python tracebacks.
+        Extract complete error blocks from log lines, including full Python tracebacks.
         
         OpenStack logs often have this format where EVERY line is prefixed with ERROR:
         2025-11-16 14:24:36.475 17 ERROR designate.module Traceback (most recent call last):
@@ -474,7 +833,7 @@ class ErrorCollector:
         This method captures the ENTIRE traceback block as ONE error.
         
         Args:
-            log_text: Raw log text
+            lines: Log lines without line endings (any iterable, e.g. a pipe being read)
             pod_name: Name of the pod
             service: Service name
             pod_type: Type of pod ('openstack' or 'test')
@@ -483,46 +842,48 @@ class ErrorCollector:
             List of error dictionaries with complete traceback blocks
         """
         errors = []
-        lines = log_text.split('\n')
+        # Offsets below are relative to the current line, lines[0]
+        lines = _LineWindow(lines)
         
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        while lines.has(1):
+            line = lines[0]
             
             # Look for lines that contain "Traceback (most recent call last)" - this is the START of an error block
             # OR lines with ERROR/CRITICAL log level that are NOT part of a traceback (standalone errors)
-            # Use BOTH strict (structured log) AND flexible (keyword in prefix) detection
+            # Use BOTH strict (structured log) AND flexible (keyword in prefix) detection.
+            # The anchored DEBUG/INFO/WARNING check runs before the keyword scan:
+            # most lines are at those levels and are rejected without scanning.
             if 'Traceback (most recent call last)' in line and (
                 self._is_error_or_critical_log_level(line) or 
-                (self._has_error_keywords_in_prefix(line) and not self._is_debug_info_warning_level(line))
+                (not self._is_debug_info_warning_level(line) and self._has_error_keywords_in_prefix(line))
             ):
                 # Found the start of a traceback
                 # Start error block with the traceback line
                 error_block = [line]
                 
                 # Extract timestamp and base pattern from first line
-                timestamp_match = re.search(r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})', line)
+                timestamp_match = _TIMESTAMP_RE.search(line)
                 timestamp = timestamp_match.group(1) if timestamp_match else None
-                severity = 'CRITICAL' if 'CRITICAL' in line.upper() else 'ERROR'
+                severity = 'CRITICAL' if _CRITICAL_RE.search(line) else 'ERROR'
                 
                 # Extract the module prefix pattern (e.g., "ERROR designate.objects.adapters.base")
                 # to identify continuation lines
-                prefix_match = re.search(r'(ERROR|CRITICAL)\s+[\w\.]+', line, re.IGNORECASE)
+                prefix_match = _MODULE_PREFIX_RE.search(line)
                 module_prefix = prefix_match.group(0) if prefix_match else None
                 
                 # Capture all subsequent lines that are part of this traceback
-                j = i + 1
+                j = 1
                 max_lines = 200
                 
-                while j < len(lines) and j < i + max_lines:
+                while j < max_lines and lines.has(j + 1):
                     next_line = lines[j]
                     
                     # If empty line, check if next line is a new log entry
-                    if not next_line.strip():
-                        if j + 1 < len(lines):
+                    if lines.is_blank(j):
+                        if lines.has(j + 2):
                             peek_line = lines[j + 1]
                             # If next line is a new timestamp + different pattern, stop
-                            if re.match(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}', peek_line):
+                            if lines.starts_entry(j + 1):
                                 # Check if it's the same module continuing or a new entry
                                 if module_prefix and module_prefix not in peek_line:
                                     break
@@ -538,12 +899,12 @@ class ErrorCollector:
                         if module_prefix and module_prefix in next_line:
                             is_continuation = True
                         # Also capture lines with same timestamp but different format (e.g., HTTP logs after error)
-                        elif not re.search(r'(INFO|DEBUG|WARNING)\s', next_line, re.IGNORECASE):
+                        elif not _NON_ERROR_LEVEL_RE.search(next_line):
                             is_continuation = True
                     elif next_line.startswith('    ') or next_line.startswith('\t'):
                         # Indented line (traceback continuation)
                         is_continuation = True
-                    elif re.match(r'^\s+File\s+"', next_line):
+                    elif next_line[:1].isspace() and _STACK_FRAME_RE.match(next_line):
                         # Stack frame line
                         is_continuation = True
                     
@@ -552,7 +913,7 @@ class ErrorCollector:
                         j += 1
                     else:
                         # Check if this is a new log entry (different timestamp + module)
-                        if re.match(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}', next_line):
+                        if lines.starts_entry(j):
                             # New log entry - stop here
                             break
                         else:
@@ -577,11 +938,11 @@ class ErrorCollector:
                     logger.debug(f"Extracted {len(error_block)}-line traceback block from {pod_name}")
                 
                 # Skip all processed lines
-                i = j
+                lines.advance(j)
                 
             elif self._is_error_or_critical_log_level(line) or (
-                self._has_error_keywords_in_prefix(line) and 
-                not self._is_debug_info_warning_level(line)
+                not self._is_debug_info_warning_level(line) and
+                self._has_error_keywords_in_prefix(line)
             ):
                 # This is an ERROR/CRITICAL line detected by:
                 #   1. Strict method: actual ERROR/CRITICAL log level in structured log
@@ -591,37 +952,32 @@ class ErrorCollector:
                 # Skip if this looks like a traceback fragment
                 if ('File "' in line[:100] or 
                     'Traceback' in line[:100] or
-                    re.match(r'^\s+(File|return|raise|def|class)', line.strip())):
-                    i += 1
+                    _TRACEBACK_FRAGMENT_RE.match(line)):
+                    lines.advance(1)
                     continue
                 
                 # This is a standalone error (not a traceback)
-                timestamp_match = re.search(r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})', line)
+                timestamp_match = _TIMESTAMP_RE.search(line)
                 timestamp = timestamp_match.group(1) if timestamp_match else None
                 
                 # Determine severity from keywords in line
-                line_upper = line.upper()
-                if 'CRITICAL' in line_upper:
-                    severity = 'CRITICAL'
-                elif 'FAILED' in line_upper or 'EXCEPTION' in line_upper:
-                    severity = 'ERROR'  # Treat FAILED/EXCEPTION as ERROR
-                else:
-                    severity = 'ERROR'
+                # (FAILED/EXCEPTION and everything else count as ERROR)
+                severity = 'CRITICAL' if _CRITICAL_RE.search(line) else 'ERROR'
                 
                 # Start with the error line
                 error_block = [line]
                 
                 # Look for continuation lines (same timestamp, no ERROR prefix)
-                j = i + 1
-                while j < len(lines) and j < i + 50:
+                j = 1
+                while j < 50 and lines.has(j + 1):
                     next_line = lines[j]
                     
                     # Stop at next log entry
-                    if re.match(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}', next_line):
+                    if lines.starts_entry(j):
                         break
                     
                     # Stop at empty line
-                    if not next_line.strip():
+                    if lines.is_blank(j):
                         break
                     
                     error_block.append(next_line)
@@ -643,9 +999,9 @@ class ErrorCollector:
                     
                     logger.debug(f"Extracted standalone error from {pod_name}")
                 
-                i = j
+                lines.advance(j)
             else:
-                i += 1
+                lines.advance(1)
         
         return errors
     
@@ -671,32 +1027,25 @@ class ErrorCollector:
                 pod_name,
                 '-n', self.namespace,
                 '--since-time', since_str,
-                '--tail', '-1'  # Get all logs since time
+                '--tail', str(self.max_log_lines)  # -1 = all logs since time
             ]
             
             logger.debug(f"Getting logs for {pod_name} since {since_str}")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
             
-            if result.returncode != 0:
-                logger.warning(f"Failed to get logs for {pod_name}: {result.stderr}")
-                return []
+            def _extract(stream):
+                # Strip ANSI color codes from logs before processing
+                # ANSI codes like \x1b[32m (green) or [00m (reset) interfere with detection
+                lines = (self._strip_ansi_codes(line.rstrip('\n')) for line in stream)
+                return self._extract_error_blocks(lines, pod_name, service, pod_type)
             
-            log_text = result.stdout
-            if not log_text.strip():
-                logger.debug(f"No logs found for {pod_name}")
-                return []
+            errors, returncode, stderr = self._consume_log_stream(cmd, _extract, _LOG_FETCH_TIMEOUT)
             
-            # Strip ANSI color codes from logs before processing
-            # ANSI codes like \x1b[32m (green) or [00m (reset) interfere with detection
-            log_text = self._strip_ansi_codes(log_text)
-            
-            errors = self._extract_error_blocks(log_text, pod_name, service, pod_type)
-            
-            if errors:
-                with_traceback = sum(1 for e in errors if e.get('has_traceback'))
-                pod_type_label = "test" if pod_type == "test" else "service"
-                logger.info(f"Found {len(errors)} error(s) in {pod_name} ({pod_type_label} pod, {with_traceback} with full tracebacks)")
+            # grep exits with 1 when nothing matched, so only oc's status counts
+            if returncode != 0:
+                logger.warning(f"Failed to get logs for {pod_name}: {stderr}")
+                return []
             
+            self._log_pod_errors(pod_name, errors, pod_type)
             return errors
             
         except subprocess.TimeoutExpired:
@@ -706,6 +1055,138 @@ class ErrorCollector:
             logger.error(f"Error parsing logs for {pod_name}: {e}")
             return []
     
+    def _log_pod_errors(self, pod_name: str, errors: List[Dict], pod_type: str) -> None:
+        """
+        Log how many errors were found in a pod.
+        
+        Args:
+            pod_name: Name of the pod
+            errors: Errors extracted from its logs
+            pod_type: Type of pod ('openstack' or 'test')
+        """
+        if errors:
+            with_traceback = sum(1 for e in errors if e.get('has_traceback'))
+            pod_type_label = "test" if pod_type == "test" else "service"
+            logger.info(f"Found {len(errors)} error(s) in {pod_name} ({pod_type_label} pod, {with_traceback} with full tracebacks)")
+    
+    def parse_selected_pods(self, pods: List[Dict], since_time: datetime) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Parse logs from several pods with a single `oc logs -l` call.
+        
+        Uses self.log_selector. With --prefix every line starts with
+        "[pod/<name>/<container>] "; without --follow oc writes the pods one
+        after another, so the stream is split into per-pod runs and each run
+        is fed to _extract_error_blocks as it streams in.
+        
+        Args:
+            pods: Pod info dictionaries as returned by detect_openstack_pods()
+            since_time: Only get logs from this time onwards
+        
+        Returns:
+            Dictionary mapping pod name to its error list, in the order of `pods`,
+            or None if the batched fetch failed (callers fall back to per-pod fetches)
+        """
+        try:
+            since_str = since_time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z'
+            
+            cmd = [
+                'oc', 'logs',
+                '-l', self.log_selector,
+                '-n', self.namespace,
+                '--prefix',
+                '--since-time', since_str,
+                '--tail', str(self.max_log_lines)  # -1 = all logs since time
+            ]
+            
+            logger.info(f"Collecting errors from {len(pods)} pods matching {self.log_selector}...")
+            pods_by_name = {pod_info['name']: pod_info for pod_info in pods}
+            
+            def _split_by_pod(stream):
+                for line in stream:
+                    line = line.rstrip('\n')
+                    if line.startswith('[pod/'):
+                        end = line.find('] ')
+                        if end != -1:
+                            yield line[5:end].split('/', 1)[0], line[end + 2:]
+            
+            def _extract(stream):
+                errors_by_pod = {}
+                for pod_name, run in groupby(_split_by_pod(stream), key=itemgetter(0)):
+                    pod_info = pods_by_name.get(pod_name)
+                    if pod_info is None:
+                        continue  # selected by the label but not a monitored pod
+                    pod_type = pod_info.get('type', 'openstack')
+                    lines = (self._strip_ansi_codes(line) for _, line in run)
+                    errors = self._extract_error_blocks(lines, pod_name, pod_info['service'], pod_type)
+                    errors_by_pod.setdefault(pod_name, []).extend(errors)
+                return errors_by_pod
+            
+            # oc reads the pods sequentially, so allow each its usual share
+            errors_by_pod, returncode, stderr = self._consume_log_stream(
+                cmd, _extract, _LOG_FETCH_TIMEOUT * len(pods))
+            
+            if returncode != 0:
+                logger.warning(f"Failed to get logs for selector {self.log_selector}: {stderr}")
+                return None
+            
+            results = {}
+            for pod_info in pods:
+                pod_name = pod_info['name']
+                results[pod_name] = errors_by_pod.get(pod_name, [])
+                self._log_pod_errors(pod_name, results[pod_name], pod_info.get('type', 'openstack'))
+            return results
+            
+        except subprocess.TimeoutExpired:
+            logger.error(f"Timeout getting logs for selector {self.log_selector}")
+            return None
+        except Exception as e:
+            logger.error(f"Error parsing logs for selector {self.log_selector}: {e}")
+            return None
+    
+    def parse_all_pods(self, pods: List[Dict], since_time: datetime) -> Dict[str, List[Dict]]:
+        """
+        Parse logs from several pods concurrently.
+        
+        Each fetch is dominated by waiting on the `oc logs` round-trip, so the
+        pods are handled in a thread pool rather than one after another, or in
+        a process pool when self.parse_processes is set so that the parsing
+        of different pods isn't serialized by the GIL.
+        
+        Args:
+            pods: Pod info dictionaries as returned by detect_openstack_pods()
+            since_time: Only get logs from this time onwards
+        
+        Returns:
+            Dictionary mapping pod name to its error list, in the order of `pods`
+        """
+        if not pods:
+            return {}
+        
+        if self.log_selector:
+            results = self.parse_selected_pods(pods, since_time)
+            if results is not None:
+                return results
+            logger.warning("Falling back to fetching logs pod by pod")
+        
+        if self.parse_processes > 1:
+            executor = ProcessPoolExecutor(max_workers=min(len(pods), self.parse_processes))
+        else:
+            executor = ThreadPoolExecutor(max_workers=min(len(pods), _MAX_LOG_WORKERS))
+        
+        with executor:
+            futures = []
+            for pod_info in pods:
+                pod_name = pod_info['name']
+                pod_type = pod_info.get('type', 'openstack')
+                
+                logger.info(f"Collecting errors from {pod_name}...")
+                future = executor.submit(self.parse_pod_logs, pod_name, pod_info['service'],
+                                         since_time=since_time, pod_type=pod_type)
+                futures.append((pod_name, future))
+            
+            # Collect in pod order so the results don't depend on scheduling
+            return {pod_name: future.result() for pod_name, future in futures}
+    
     def _deduplicate_errors(self, all_errors: List[Dict]) -> List[Dict]:
         """
         Deduplicate errors using fuzzy matching.
@@ -727,44 +1208,108 @@ class ErrorCollector:
         unique_errors = []
         total = len(all_errors)
         
+        # Score all distinct texts against each other in a single multi-threaded
+        # rapidfuzz call. Indel ratio is never below SequenceMatcher's ratio, so
+        # a zero (under the cutoff) entry rules the pair out.
+        pair_scores = None
+        if process is not None and (os.cpu_count() or 1) >= _CDIST_MIN_CPUS:
+            distinct_texts = list(dict.fromkeys(error['normalized_text'] for error in all_errors))
+            if len(distinct_texts) <= _CDIST_MAX_TEXTS:
+                text_rows = {text: row for row, text in enumerate(distinct_texts)}
+                pair_scores = process.cdist(
+                    distinct_texts,
+                    distinct_texts,
+                    scorer=fuzz.ratio,
+                    score_cutoff=self.similarity_threshold,
+                    dtype='uint8',
+                    workers=-1
+                )
+                # Matrix column of each unique error's text, in list order
+                unique_columns = []
+        
+        # normalized_text -> unique error it was grouped into. Unique errors are
+        # only ever appended, so an identical text always lands in the same group
+        # again and can skip the similarity scan entirely.
+        exact_index = {}
+        
+        # SequenceMatcher per unique text, so its seq2 index is built only once
+        matchers = {}
+        
+        # Length band -> indexes into unique_errors. ratio() can't exceed
+        # 2*min/(len1+len2), so a pair only reaches the threshold when the
+        # shorter text is at least t/(2-t) of the longer one.
+        len_buckets = defaultdict(list)
+        threshold = self.similarity_threshold / 100
+        min_len_ratio = threshold / (2 - threshold)
+        
         for idx, error in enumerate(all_errors, 1):
             # Log progress every 100 errors
             if idx % 100 == 0 or idx == total:
                 logger.info(f"  Progress: {idx}/{total} errors processed ({len(unique_errors)} unique so far)...")
+            normalized_text = error['normalized_text']
+            
             # Check if this error is similar to any existing unique error
-            found_match = False
+            match = exact_index.get(normalized_text)
             
-            for unique_error in unique_errors:
-                similarity = self._calculate_similarity(
-                    error['normalized_text'],
-                    unique_error['normalized_text']
-                )
+            if match is None:
+                length = len(normalized_text)
+                if pair_scores is not None:
+                    row = pair_scores[text_rows[normalized_text]]
+                    keys = row.take(unique_columns).nonzero()[0] if unique_columns else ()
+                else:
+                    low = int(length * min_len_ratio) // _LEN_BUCKET_WIDTH
+                    high = int(length / min_len_ratio) // _LEN_BUCKET_WIDTH if min_len_ratio else max(len_buckets, default=0)
+                    keys = [key for bucket in range(low, high + 1) for key in len_buckets.get(bucket, ())]
+                # Keep list order so the first similar unique error still wins
+                candidates = [unique_errors[key] for key in sorted(keys)]
                 
-                if similarity >= self.similarity_threshold:
-                    # This is a duplicate - increment count and track occurrences
-                    unique_error['count'] += 1
-                    unique_error['occurrences'].append({
-                        'pod_name': error['pod_name'],
-                        'timestamp': error['timestamp']
-                    })
-                    
-                    # Update last_seen
-                    if error['timestamp']:
-                        if not unique_error['last_seen'] or error['timestamp'] > unique_error['last_seen']:
-                            unique_error['last_seen'] = error['timestamp']
+                if pair_scores is None and process is not None and len(candidates) > 1:
+                    # rapidfuzz's Indel ratio is 2*LCS/(len1+len2), never below
+                    # SequenceMatcher's ratio, so anything it scores under the
+                    # threshold can't match. Score all candidates in one C++ call
+                    # and only confirm the survivors, still in list order.
+                    shortlist = process.extract(
+                        normalized_text,
+                        [unique_error['normalized_text'] for unique_error in candidates],
+                        scorer=fuzz.ratio,
+                        score_cutoff=self.similarity_threshold,
+                        limit=None
+                    )
+                    candidates = [candidates[key] for key in sorted(result[2] for result in shortlist)]
+                
+                for unique_error in candidates:
+                    similarity = self._calculate_similarity(
+                        normalized_text,
+                        unique_error['normalized_text'],
+                        score_cutoff=self.similarity_threshold,
+                        matchers=matchers
+                    )
                     
-                    found_match = True
-                    break
+                    if similarity >= self.similarity_threshold:
+                        match = unique_error
+                        break
             
-            if not found_match:
+            if match is not None:
+                # This is a duplicate - increment count and track occurrences
+                match['count'] += 1
+                match['occurrences'].append({
+                    'pod_name': error['pod_name'],
+                    'timestamp': error['timestamp']
+                })
+                
+                # Update last_seen
+                if error['timestamp']:
+                    if not match['last_seen'] or error['timestamp'] > match['last_seen']:
+                        match['last_seen'] = error['timestamp']
+            else:
                 # This is a new unique error
-                unique_errors.append({
+                match = {
                     'pod_name': error['pod_name'],
                     'service': error['service'],
                     'pod_type': error.get('pod_type', 'openstack'),
                     'severity': error['severity'],
                     'error_text': error['error_text'],
-                    'normalized_text': error['normalized_text'],
+                    'normalized_text': normalized_text,
                     'first_seen': error['timestamp'],
                     'last_seen': error['timestamp'],
                     'count': 1,
@@ -772,7 +1317,13 @@ class ErrorCollector:
                         'pod_name': error['pod_name'],
                         'timestamp': error['timestamp']
                     }]
-                })
+                }
+                unique_errors.append(match)
+                len_buckets[len(normalized_text) // _LEN_BUCKET_WIDTH].append(len(unique_errors) - 1)
+                if pair_scores is not None:
+                    unique_columns.append(text_rows[normalized_text])
+            
+            exact_index[normalized_text] = match
         
         # Sort by severity (CRITICAL first) then by count (most frequent first)
         unique_errors.sort(key=lambda x: (
@@ -821,14 +1372,7 @@ class ErrorCollector:
         all_errors = []
         pods_analyzed = []
         
-        for pod_info in pods:
-            pod_name = pod_info['name']
-            service = pod_info['service']
-            pod_type = pod_info.get('type', 'openstack')
-            
-            logger.info(f"Collecting errors from {pod_name}...")
-            errors = self.parse_pod_logs(pod_name, service, since_time=since_time, pod_type=pod_type)
-            
+        for pod_name, errors in self.parse_all_pods(pods, since_time).items():
             if errors:
                 all_errors.extend(errors)
                 pods_analyzed.append(pod_name)
@@ -16,13 +16,75 @@ Example:
 import argparse
 import logging
 import os
+import re
 import sys
-import socket
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from csv_exporter import CSVExporter
-import pandas as pd
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import glob
 
+# pandas, pyarrow and csv_exporter (matplotlib, plotly) take about a second
+# to import, so they are imported where they are used and --help or a bad
+# results directory returns at once
+if TYPE_CHECKING:
+    import pandas as pd
+    from csv_exporter import CSVExporter
+
+# Role of each results CSV, by a fragment of its file name: a CSVExporter
+# attribute, or 'api'/'error' for the files read here
+_CSV_ROLES = {
+    "api_requests": ("api", "API Requests CSV"),
+    "failed_tests": ("failed_tests_csv", "Failed Tests CSV"),
+    "test_execution_times": ("test_execution_csv", "Test Execution Times CSV"),
+    "error_log": ("error", "Error Log CSV"),
+    "metrics": ("metrics_csv", "Metrics CSV"),
+    "results": ("results_csv", "Results CSV"),
+}
+
+# Finds the last role fragment in a file name in one pass. CSVExporter writes
+# "<csv_filename>_<fragment>_<timestamp>.csv", so the last one is the kind even
+# when csv_filename itself contains a fragment (e.g. "metrics_run").
+_CSV_ROLE_RE = re.compile(r".*(" + "|".join(_CSV_ROLES) + r")")
+
+# ANSI color codes for the download banner
+_GREEN = "\033[1;32m"
+_CYAN = "\033[1;36m"
+_YELLOW = "\033[1;33m"
+_BLUE = "\033[1;34m"
+_RESET = "\033[0m"
+_RULE = f"{_CYAN}{'=' * 60}{_RESET}"
+
+# Download commands for the results archive. Without -t there is no
+# pseudo-terminal, so ssh passes the bytes through untouched and base64
+# (+33% size, encode and decode) is only needed with --base64-fallback
+_RAW_DOWNLOAD_COMMAND = "ssh <your_bastion_host> \"su - zuul -c 'ssh -q {hostname} \\\"cat {archive_path}\\\"'\" > {basename}"
+_BASE64_DOWNLOAD_COMMAND = "ssh <your_bastion_host> \"su - zuul -c 'ssh -q {hostname} \\\"base64 {archive_path}\\\"'\" | base64 -d > {basename}"
+_RAW_DOWNLOAD_NOTES = (
+    "  • Streams the raw ZIP (no -t, so the binary data isn't altered)\n"
+    "  • If the ZIP comes out corrupted, rerun with --base64-fallback"
+)
+_BASE64_DOWNLOAD_NOTES = "  • Uses base64 encoding for reliable binary transfer"
+
+# Static part of the download banner; only the command and its notes vary
+_DOWNLOAD_BANNER = f"""
+{_RULE}
+{_GREEN}DOWNLOAD COMMAND FOR RESULTS ARCHIVE{_RESET}
+{_RULE}
+{_YELLOW}All results are packaged in a single ZIP file.{_RESET}
+Copy and paste this command on your local desktop:
+(Replace <your_bastion_host> with your actual bastion hostname)
+
+{_BLUE}{{command}}{_RESET}
+
+{_YELLOW}Why this command?{_RESET}
+{{notes}}
+  • Works through nested SSH (bastion → controller)
+  • Single command - no intermediate files
+  • Archive contains: index.html + src/ (web report)
+{_RULE}
+"""
+
 
 def setup_logging():
     """Setup logging configuration."""
@@ -33,37 +95,120 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
-def validate_results_directory(results_dir: str) -> bool:
+@lru_cache(maxsize=None)
+def _import_pyarrow():
+    """
+    Import pyarrow and the submodules used here, once.
+    
+    Returns:
+        Tuple of (pyarrow, pyarrow.compute, pyarrow.csv), or None if pyarrow
+        is not installed (optional: the API requests CSV is read with pandas)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+    return pa, pc, pacsv
+
+
+def _iter_csvs(results_dir: str):
+    """
+    Yield the CSV files directly inside a directory, in a single scandir pass.
+    
+    Matches what glob's "*.csv" returned (hidden files are skipped), without
+    building the whole list first.
+    
+    Args:
+        results_dir: Path to results directory
+        
+    Yields:
+        os.DirEntry for each CSV file
+    """
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".csv") and not entry.name.startswith(".") and entry.is_file():
+                yield entry
+
+
+def validate_results_directory(results_dir: str) -> Optional[List[os.DirEntry]]:
     """
     Validate that the results directory exists and contains CSV files.
     
+    The CSV files are listed in the same scan, so callers don't rescan the directory.
+    
     Args:
         results_dir: Path to results directory
         
     Returns:
-        True if valid, False otherwise
+        The directory's CSV files sorted by name, or None if it is not valid
     """
     if not os.path.exists(results_dir):
-        return False
+        return None
     
     if not os.path.isdir(results_dir):
-        return False
+        return None
     
     # Check for at least one CSV file
-    csv_files = glob.glob(os.path.join(results_dir, "*.csv"))
-    return len(csv_files) > 0
+    csv_files = sorted(_iter_csvs(results_dir), key=lambda entry: entry.name)
+    return csv_files or None
+
+
+def _read_csv_cache(csv_file: str) -> Optional["pd.DataFrame"]:
+    """
+    Load the Parquet copy of a CSV written by an earlier run, if it is current.
+    
+    Args:
+        csv_file: Path to the CSV file
+        
+    Returns:
+        Cached DataFrame, or None if there is no up-to-date cache
+    """
+    if _import_pyarrow() is None:
+        return None
+    import pandas as pd
+    cache_file = csv_file + ".parquet"
+    try:
+        if os.stat(cache_file).st_mtime >= os.stat(csv_file).st_mtime:
+            return pd.read_parquet(cache_file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable CSV cache {cache_file}: {e}")
+    return None
 
 
-def calculate_test_summary(results_dir: str) -> dict:
+def _write_csv_cache(csv_file: str, df: "pd.DataFrame") -> None:
+    """
+    Save a parsed CSV as Parquet next to it, so reruns skip the CSV parse.
+    
+    Args:
+        csv_file: Path to the CSV file
+        df: DataFrame parsed from it
+    """
+    if _import_pyarrow() is None:
+        return
+    cache_file = csv_file + ".parquet"
+    try:
+        df.to_parquet(cache_file, compression="zstd")
+    except Exception as e:
+        logging.warning(f"Could not write CSV cache {cache_file}: {e}")
+
+
+def calculate_test_summary(results_dir: str, use_cache: bool = True) -> dict:
     """
     Calculate test summary statistics from results CSV file.
     
     Args:
         results_dir: Path to results directory
+        use_cache: Reuse (and write) the Parquet copy of the results CSV
         
     Returns:
         Dictionary with test statistics
     """
+    import pandas as pd
+    
     # Find results CSV file
     results_csv_pattern = os.path.join(results_dir, "tempest_monitoring_results_*.csv")
     results_files = glob.glob(results_csv_pattern)
@@ -77,11 +222,26 @@ def calculate_test_summary(results_dir: str) -> dict:
             'tests_skipped': 0
         }
     
-    # Read the most recent results file
-    results_file = sorted(results_files)[-1]
+    # Read the most recent results file; the names end in a sortable
+    # timestamp, so the newest is simply the largest (mtime changes when
+    # results are copied between hosts)
+    results_file = max(results_files)
     
     try:
-        df = pd.read_csv(results_file)
+        # Only the test counts are summed; 'timestamp' (always the first column)
+        # is kept so the row count doesn't depend on them being present.
+        # Nullable Int64 skips type inference and keeps blank cells as NA
+        # instead of turning the whole column into floats.
+        count_columns = ['tests_passed', 'tests_failed', 'tests_skipped']
+        df = _read_csv_cache(results_file) if use_cache else None
+        if df is None:
+            df = pd.read_csv(
+                results_file,
+                usecols=lambda column: column == 'timestamp' or column in count_columns,
+                dtype={column: 'Int64' for column in count_columns}
+            )
+            if use_cache:
+                _write_csv_cache(results_file, df)
         
         # Calculate test-level statistics
         total_tests_passed = df['tests_passed'].sum() if 'tests_passed' in df.columns else 0
@@ -107,6 +267,201 @@ def calculate_test_summary(results_dir: str) -> dict:
         }
 
 
+def _generate_error_report(csv_exporter: "CSVExporter", error_csv_file: str) -> List[str]:
+    """
+    Rebuild the error report from the error_log CSV.
+    
+    Args:
+        csv_exporter: CSVExporter mapped onto the results directory
+        error_csv_file: Path to the error_log CSV
+        
+    Returns:
+        List with the error report path (empty if none was generated)
+    """
+    import pandas as pd
+    
+    logger = logging.getLogger(__name__)
+    graph_files = []
+    logger.info("\nGenerating error report from CSV...")
+    try:
+        # Read error CSV
+        error_df = pd.read_csv(error_csv_file)
+        if not error_df.empty:
+            # Convert CSV back to error_data format
+            unique_errors = []
+            by_service = {}
+            critical_count = 0
+            pods_analyzed = set()
+            
+            for _, row in error_df.iterrows():
+                error = {
+                    'severity': row['severity'],
+                    'service': row['service'],
+                    'pod_type': row['pod_type'],
+                    'pod_name': row['pod_name'],
+                    'first_seen': row['first_seen'],
+                    'last_seen': row['last_seen'],
+                    'count': int(row['count']),
+                    'error_text': row['error_text'],
+                    'occurrences': []  # Not needed for report generation
+                }
+                unique_errors.append(error)
+                
+                # Count by service
+                service = row['service']
+                by_service[service] = by_service.get(service, 0) + int(row['count'])
+                
+                # Count critical
+                if row['severity'] == 'CRITICAL':
+                    critical_count += int(row['count'])
+                
+                # Track pods
+                pods_analyzed.add(row['pod_name'])
+            
+            # Build error_data structure
+            error_data = {
+                'unique_errors': unique_errors,
+                'total_errors': error_df['count'].sum(),
+                'unique_count': len(unique_errors),
+                'critical_count': critical_count,
+                'by_service': by_service,
+                'pods_analyzed': list(pods_analyzed)
+            }
+            
+            # Generate error report HTML
+            error_report_html = csv_exporter.generate_error_report(error_data)
+            if error_report_html:
+                graph_files.append(error_report_html)
+                logger.info(f"  ✓ Error report: {os.path.basename(error_report_html)}")
+        else:
+            logger.warning("  Error CSV is empty, skipping error report")
+    except Exception as e:
+        logger.error(f"Error generating error report: {e}")
+        logger.warning("Continuing without error report...")
+    
+    return graph_files
+
+
+def _generate_csv_graphs(csv_exporter: "CSVExporter") -> List[str]:
+    """
+    Generate the pod metrics, test results and test execution times graphs.
+    
+    Args:
+        csv_exporter: CSVExporter mapped onto the results directory
+        
+    Returns:
+        List of paths to generated graph files
+    """
+    logger = logging.getLogger(__name__)
+    graph_files = []
+    logger.info("\nGenerating graphs from CSV data...")
+    try:
+        generated_graphs = csv_exporter.generate_graphs()
+        if generated_graphs:
+            graph_files.extend(generated_graphs)
+            logger.info(f"Successfully generated {len(generated_graphs)} graph(s):")
+            for graph_file in generated_graphs:
+                logger.info(f"  ✓ {os.path.basename(graph_file)}")
+        else:
+            logger.warning("No graphs were generated (possibly insufficient data)")
+    except Exception as e:
+        logger.error(f"Error generating graphs: {e}")
+        logger.warning("Continuing without graphs...")
+    
+    return graph_files
+
+
+def _read_api_requests(api_csv_file: str, use_cache: bool = True) -> Tuple["pd.DataFrame", int]:
+    """
+    Read the API requests CSV and count its error requests.
+    
+    With pyarrow the CSV is parsed on all cores and the error count is taken
+    on the Arrow column; service is dictionary-encoded, which to_pandas()
+    turns into a category. Otherwise pandas reads it and service is converted
+    to a category afterwards (a handful of distinct values, one per row).
+    
+    Args:
+        api_csv_file: Path to the API requests CSV
+        use_cache: Reuse (and write) the Parquet copy of the CSV
+        
+    Returns:
+        Tuple of (requests DataFrame, number of error requests)
+    """
+    import pandas as pd
+    
+    api_df = _read_csv_cache(api_csv_file) if use_cache else None
+    if api_df is not None:
+        error_requests = int(api_df['is_error'].sum()) if 'is_error' in api_df.columns else 0
+        return api_df, error_requests
+    
+    arrow = _import_pyarrow()
+    if arrow is not None:
+        pa, pc, pacsv = arrow
+        convert_options = pacsv.ConvertOptions(column_types={
+            'service': pa.dictionary(pa.int32(), pa.string()),
+            'is_error': pa.bool_()
+        })
+        api_table = pacsv.read_csv(api_csv_file, convert_options=convert_options)
+        error_requests = 0
+        if 'is_error' in api_table.column_names:
+            error_requests = pc.sum(api_table['is_error']).as_py() or 0
+        api_df = api_table.to_pandas()
+        if use_cache:
+            _write_csv_cache(api_csv_file, api_df)
+        return api_df, error_requests
+    
+    api_df = pd.read_csv(api_csv_file)
+    if 'service' in api_df.columns:
+        api_df['service'] = api_df['service'].astype('category')
+    error_requests = int(api_df['is_error'].sum()) if 'is_error' in api_df.columns else 0
+    return api_df, error_requests
+
+
+def _generate_api_graph(csv_exporter: "CSVExporter", api_csv_file: str, use_cache: bool = True) -> List[str]:
+    """
+    Generate the API performance graph from the API requests CSV.
+    
+    Args:
+        csv_exporter: CSVExporter mapped onto the results directory
+        api_csv_file: Path to the API requests CSV
+        use_cache: Reuse (and write) the Parquet copy of the CSV
+        
+    Returns:
+        List with the API graph path (empty if none was generated)
+    """
+    logger = logging.getLogger(__name__)
+    graph_files = []
+    logger.info("\nGenerating API performance graph from CSV...")
+    try:
+        # Read API requests CSV
+        api_df, error_requests = _read_api_requests(api_csv_file, use_cache)
+        if not api_df.empty:
+            # Convert to format expected by generate_api_performance_graph,
+            # which takes the frame itself rather than one dict per row
+            api_data = {
+                'requests': api_df,
+                'total_requests': len(api_df),
+                'error_requests': error_requests,
+                'by_service': {}
+            }
+            # Group by service
+            if 'service' in api_df.columns:
+                for service, group in api_df.groupby('service', observed=True):
+                    api_data['by_service'][service] = group
+            
+            api_graph = csv_exporter.generate_api_performance_graph(api_data)
+            if api_graph:
+                graph_files.append(api_graph)
+                logger.info(f"  ✓ API graph: {os.path.basename(api_graph)}")
+        else:
+            logger.warning("  API CSV is empty, skipping API graph")
+    except Exception as e:
+        logger.error(f"Error generating API graph: {e}")
+        logger.warning("Continuing without API graph...")
+    
+    return graph_files
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -118,6 +473,10 @@ Examples:
   python generate_reports.py /home/zuul/RunTempestMonitorPods/results
   python generate_reports.py results/ --graph-format png
   python generate_reports.py results/ --no-graphs
+  python generate_reports.py results/ --base64-fallback
+  python generate_reports.py results/ --jobs 3
+  python generate_reports.py results/ --archive-compression stored
+  python generate_reports.py results/ --no-cache
         """
     )
     parser.add_argument(
@@ -135,6 +494,29 @@ Examples:
         action='store_true',
         help='Skip graph generation (only create web report and archive)'
     )
+    parser.add_argument(
+        '--base64-fallback',
+        action='store_true',
+        help='Print the download command with base64 encoding, for shells that write extra output to stdout'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for the error report and graphs (default: 1, sequential)'
+    )
+    parser.add_argument(
+        '--archive-compression',
+        choices=['auto', 'stored', 'deflate', 'zstd'],
+        default='auto',
+        help='Results archive compression (default: auto - stored for PNG/PDF, deflate for text; '
+             'stored is always safe for already-compressed files; zstd needs Python 3.14+)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-parse the results and API CSVs instead of reusing their .csv.parquet copies from a previous run'
+    )
     
     args = parser.parse_args()
     
@@ -144,16 +526,27 @@ Examples:
     results_dir = os.path.abspath(args.results_dir)
     logger.info(f"Processing results from: {results_dir}")
     
-    if not validate_results_directory(results_dir):
+    csv_files = validate_results_directory(results_dir)
+    if csv_files is None:
         logger.error(f"Invalid results directory: {results_dir}")
         logger.error("Directory must exist and contain CSV files")
         sys.exit(1)
     
-    # List CSV files found
-    csv_files = glob.glob(os.path.join(results_dir, "*.csv"))
-    logger.info(f"Found {len(csv_files)} CSV file(s):")
-    for csv_file in sorted(csv_files):
-        logger.info(f"  - {os.path.basename(csv_file)}")
+    # List CSV files found, with sizes from the scandir entries (DirEntry
+    # caches its stat, so each file is stat'ed once). The listing is logged
+    # as one record rather than one per file.
+    lines = [f"Found {len(csv_files)} CSV file(s):"]
+    csv_bytes = 0
+    for entry in csv_files:
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            lines.append(f"  - {entry.name}")
+            continue
+        csv_bytes += size
+        lines.append(f"  - {entry.name} ({size / 1024:.1f} KB)")
+    lines.append(f"  Total CSV data: {csv_bytes / (1024 * 1024):.2f} MB")
+    logger.info("\n".join(lines))
     
     # Clean up old HTML graph files and ZIP archives from interrupted run (to avoid duplicates)
     import shutil
@@ -185,155 +578,72 @@ Examples:
     
     # Initialize CSV exporter (point to existing directory, skip archiving!)
     logger.info("\nInitializing CSV exporter...")
+    from csv_exporter import CSVExporter
     csv_exporter = CSVExporter(
         results_dir=results_dir,
         csv_filename="tempest_monitoring",  # Base filename
         enable_graphs=not args.no_graphs,
         graph_format=args.graph_format,
-        skip_archiving=True  # DON'T archive existing CSV files - we need them!
+        skip_archiving=True,  # DON'T archive existing CSV files - we need them!
+        archive_compression=args.archive_compression
     )
     
     # CRITICAL: Override the CSV file paths with actual existing files
     # (CSVExporter.__init__ creates paths with NEW timestamp, but we need OLD files)
-    logger.info("\nMapping existing CSV files to CSVExporter...")
-    api_csv_file = None
-    error_csv_file = None
-    for csv_file in csv_files:
-        basename = os.path.basename(csv_file)
+    lines = ["\nMapping existing CSV files to CSVExporter..."]
+    mapped_csvs = {}
+    for entry in csv_files:
+        basename = entry.name
         if basename.startswith("old_"):
             continue  # Skip archived files
         
-        if "metrics" in basename and "api_requests" not in basename:
-            csv_exporter.metrics_csv = csv_file
-            logger.info(f"  ✓ Metrics CSV: {basename}")
-        elif "results" in basename and "failed" not in basename and "execution" not in basename and "api_requests" not in basename:
-            csv_exporter.results_csv = csv_file
-            logger.info(f"  ✓ Results CSV: {basename}")
-        elif "failed_tests" in basename:
-            csv_exporter.failed_tests_csv = csv_file
-            logger.info(f"  ✓ Failed Tests CSV: {basename}")
-        elif "test_execution_times" in basename:
-            csv_exporter.test_execution_csv = csv_file
-            logger.info(f"  ✓ Test Execution Times CSV: {basename}")
-        elif "api_requests" in basename:
-            api_csv_file = csv_file
-            logger.info(f"  ✓ API Requests CSV: {basename}")
-        elif "error_log" in basename:
-            error_csv_file = csv_file
-            logger.info(f"  ✓ Error Log CSV: {basename}")
-    
-    # Generate graphs
-    graph_files = []
+        match = _CSV_ROLE_RE.match(basename)
+        if match:
+            role, label = _CSV_ROLES[match.group(1)]
+            mapped_csvs[role] = entry.path
+            lines.append(f"  ✓ {label}: {basename}")
+    logger.info("\n".join(lines))
+    
+    api_csv_file = mapped_csvs.pop("api", None)
+    error_csv_file = mapped_csvs.pop("error", None)
+    for attr, csv_file in mapped_csvs.items():
+        setattr(csv_exporter, attr, csv_file)
+    
+    # Generate error report and graphs. Each reads its own CSV and writes its
+    # own files, so with --jobs they run in worker processes; the web report
+    # needs all of their paths and the archive zips the web report, so those
+    # two stay sequential below
+    graph_tasks = []
     
     # Generate error report from error_log CSV if it exists
-    if error_csv_file and os.path.exists(error_csv_file):
-        logger.info("\nGenerating error report from CSV...")
-        try:
-            # Read error CSV
-            error_df = pd.read_csv(error_csv_file)
-            if not error_df.empty:
-                # Convert CSV back to error_data format
-                unique_errors = []
-                by_service = {}
-                critical_count = 0
-                pods_analyzed = set()
-                
-                for _, row in error_df.iterrows():
-                    error = {
-                        'severity': row['severity'],
-                        'service': row['service'],
-                        'pod_type': row['pod_type'],
-                        'pod_name': row['pod_name'],
-                        'first_seen': row['first_seen'],
-                        'last_seen': row['last_seen'],
-                        'count': int(row['count']),
-                        'error_text': row['error_text'],
-                        'occurrences': []  # Not needed for report generation
-                    }
-                    unique_errors.append(error)
-                    
-                    # Count by service
-                    service = row['service']
-                    by_service[service] = by_service.get(service, 0) + int(row['count'])
-                    
-                    # Count critical
-                    if row['severity'] == 'CRITICAL':
-                        critical_count += int(row['count'])
-                    
-                    # Track pods
-                    pods_analyzed.add(row['pod_name'])
-                
-                # Build error_data structure
-                error_data = {
-                    'unique_errors': unique_errors,
-                    'total_errors': error_df['count'].sum(),
-                    'unique_count': len(unique_errors),
-                    'critical_count': critical_count,
-                    'by_service': by_service,
-                    'pods_analyzed': list(pods_analyzed)
-                }
-                
-                # Generate error report HTML
-                error_report_html = csv_exporter.generate_error_report(error_data)
-                if error_report_html:
-                    graph_files.append(error_report_html)
-                    logger.info(f"  ✓ Error report: {os.path.basename(error_report_html)}")
-            else:
-                logger.warning("  Error CSV is empty, skipping error report")
-        except Exception as e:
-            logger.error(f"Error generating error report: {e}")
-            logger.warning("Continuing without error report...")
+    # The CSV paths come from the directory scan above, and a file removed
+    # since then surfaces as a read error in the handlers below
+    if error_csv_file:
+        graph_tasks.append(partial(_generate_error_report, csv_exporter, error_csv_file))
     
     if not args.no_graphs:
-        logger.info("\nGenerating graphs from CSV data...")
-        try:
-            generated_graphs = csv_exporter.generate_graphs()
-            if generated_graphs:
-                graph_files.extend(generated_graphs)
-                logger.info(f"Successfully generated {len(generated_graphs)} graph(s):")
-                for graph_file in generated_graphs:
-                    logger.info(f"  ✓ {os.path.basename(graph_file)}")
-            else:
-                logger.warning("No graphs were generated (possibly insufficient data)")
-        except Exception as e:
-            logger.error(f"Error generating graphs: {e}")
-            logger.warning("Continuing without graphs...")
+        graph_tasks.append(partial(_generate_csv_graphs, csv_exporter))
         
         # Generate API performance graph if API CSV exists
-        if api_csv_file and os.path.exists(api_csv_file):
-            logger.info("\nGenerating API performance graph from CSV...")
-            try:
-                import pandas as pd
-                # Read API requests CSV
-                api_df = pd.read_csv(api_csv_file)
-                if not api_df.empty:
-                    # Convert to format expected by generate_api_performance_graph
-                    api_data = {
-                        'requests': api_df.to_dict('records'),
-                        'total_requests': len(api_df),
-                        'error_requests': len(api_df[api_df['is_error'] == True]) if 'is_error' in api_df.columns else 0,
-                        'by_service': {}
-                    }
-                    # Group by service
-                    if 'service' in api_df.columns:
-                        for service, group in api_df.groupby('service'):
-                            api_data['by_service'][service] = group.to_dict('records')
-                    
-                    api_graph = csv_exporter.generate_api_performance_graph(api_data)
-                    if api_graph:
-                        graph_files.append(api_graph)
-                        logger.info(f"  ✓ API graph: {os.path.basename(api_graph)}")
-                else:
-                    logger.warning("  API CSV is empty, skipping API graph")
-            except Exception as e:
-                logger.error(f"Error generating API graph: {e}")
-                logger.warning("Continuing without API graph...")
+        if api_csv_file:
+            graph_tasks.append(partial(_generate_api_graph, csv_exporter, api_csv_file, not args.no_cache))
     else:
         logger.info("\nSkipping graph generation (--no-graphs specified)")
     
+    graph_files = []
+    if args.jobs > 1 and len(graph_tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(graph_tasks))) as executor:
+            futures = [executor.submit(task) for task in graph_tasks]
+            # Collected in submission order so graph_files matches a --jobs 1 run
+            for future in futures:
+                graph_files.extend(future.result())
+    else:
+        for task in graph_tasks:
+            graph_files.extend(task())
+    
     # Calculate test summary for web report
     logger.info("\nCalculating test summary...")
-    test_summary = calculate_test_summary(results_dir)
+    test_summary = calculate_test_summary(results_dir, use_cache=not args.no_cache)
     logger.info(f"  Total test runs: {test_summary['total_runs']}")
     logger.info(f"  Total tests: {test_summary['total_tests']}")
     logger.info(f"  Tests passed: {test_summary['tests_passed']}")
@@ -353,12 +663,19 @@ Examples:
         web_report_dir = None
     
     # Create archive
-    logger.info("\nCreating results archive...")
+    logger.info(f"\nCreating results archive (compression: {csv_exporter.archive_compression})...")
     try:
         archive_file = csv_exporter.create_results_archive()
-        if archive_file and os.path.exists(archive_file):
+        # A single stat() both confirms the archive exists and gives its size
+        archive_stat = None
+        if archive_file:
+            try:
+                archive_stat = os.stat(archive_file)
+            except FileNotFoundError:
+                pass
+        if archive_stat is not None:
             logger.info(f"  ✓ Archive created: {os.path.basename(archive_file)}")
-            archive_size_mb = os.path.getsize(archive_file) / (1024 * 1024)
+            archive_size_mb = archive_stat.st_size / (1024 * 1024)
             logger.info(f"  Archive size: {archive_size_mb:.2f} MB")
         else:
             logger.error("  ✗ Failed to create archive")
@@ -378,23 +695,10 @@ Examples:
         print(f"\n📊 Web Report: {web_report_dir}/index.html")
         print(f"    Upload the 'web_report' directory to your HTTP server")
     
-    # Print download command
-    if archive_file and os.path.exists(archive_file):
-        # ANSI color codes
-        GREEN = "\033[1;32m"
-        CYAN = "\033[1;36m"
-        YELLOW = "\033[1;33m"
-        BLUE = "\033[1;34m"
-        RESET = "\033[0m"
-        
-        print(f"\n{CYAN}{'='*60}{RESET}")
-        print(f"{GREEN}DOWNLOAD COMMAND FOR RESULTS ARCHIVE{RESET}")
-        print(f"{CYAN}{'='*60}{RESET}")
-        print(f"{YELLOW}All results are packaged in a single ZIP file.{RESET}")
-        print(f"Copy and paste this command on your local desktop:")
-        print(f"(Replace <your_bastion_host> with your actual bastion hostname)\n")
-        
+    # Print download command (archive_file is only kept if it was created)
+    if archive_file:
         # Get hostname
+        import socket
         try:
             hostname = socket.gethostname()
         except:
@@ -402,14 +706,13 @@ Examples:
         
         archive_path = os.path.abspath(archive_file)
         
-        print(f"{BLUE}ssh <your_bastion_host> \"su - zuul -c 'ssh -q {hostname} \\\"base64 {archive_path}\\\"'\" | base64 -d > {os.path.basename(archive_file)}{RESET}\n")
-        
-        print(f"{YELLOW}Why this command?{RESET}")
-        print(f"  • Uses base64 encoding for reliable binary transfer")
-        print(f"  • Works through nested SSH (bastion → controller)")
-        print(f"  • Single command - no intermediate files")
-        print(f"  • Archive contains: index.html + src/ (web report)")
-        print(f"{CYAN}{'='*60}{RESET}\n")
+        if args.base64_fallback:
+            command, notes = _BASE64_DOWNLOAD_COMMAND, _BASE64_DOWNLOAD_NOTES
+        else:
+            command, notes = _RAW_DOWNLOAD_COMMAND, _RAW_DOWNLOAD_NOTES
+        command = command.format(hostname=hostname, archive_path=archive_path,
+                                 basename=os.path.basename(archive_file))
+        print(_DOWNLOAD_BANNER.format(command=command, notes=notes))
     
     logger.info("Done! 🎉")
 